@@ -8,6 +8,7 @@ game state, recent activities, and contextual information.
 import logging
 import os
 import shutil
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
@@ -73,10 +74,7 @@ class EDCoPilotContextAnalyzer:
 
     def _determine_primary_activity(self, recent_events: List[ProcessedEvent]) -> str:
         """Determine the commander's primary recent activity."""
-        activity_counts = {}
-        for event in recent_events:
-            category = event.category.value
-            activity_counts[category] = activity_counts.get(category, 0) + 1
+        activity_counts = Counter(event.category.value for event in recent_events)
 
         if not activity_counts:
             return 'general'
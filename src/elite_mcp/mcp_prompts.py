@@ -5,20 +5,43 @@ Provides intelligent prompts for common Elite Dangerous tasks with context-aware
 content generation based on current game state and recent activities.
 """
 
+import heapq
 import logging
-from datetime import datetime, timezone, timedelta
+import string
+import time
+from collections import Counter, defaultdict
 from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
+from itertools import islice
+from operator import itemgetter
 
 try:
-    from ..utils.data_store import DataStore
+    from ..utils.data_store import DataStore, GameState
     from ..journal.events import EventCategory
 except ImportError:
-    from src.utils.data_store import DataStore
+    from src.utils.data_store import DataStore, GameState
     from src.journal.events import EventCategory
 
 logger = logging.getLogger(__name__)
 
+_formatter = string.Formatter()
+
+# Safe defaults for numerically formatted template variables
+_NUMERIC_DEFAULTS: Dict[str, Any] = {
+    'credits': 0,
+    'exploration_earnings': 0,
+    'distance_ly': 0.0,
+    'time_range': 0,
+}
+
+
+def _group_events_by_type(events: List) -> Dict[str, List]:
+    """Group events by event type in a single pass, keeping their order."""
+    events_by_type: Dict[str, List] = defaultdict(list)
+    for event in events:
+        events_by_type[event.event_type].append(event)
+    return events_by_type
+
 
 class PromptType(Enum):
     """Types of MCP prompts available."""
@@ -50,6 +73,24 @@ class PromptTemplate:
         self.description = description
         self.template = template
         self.variables = variables
+        self._variables_set = frozenset(variables)
+        
+        # Parse the format string once; render() then only formats the fields.
+        # Templates using nested fields or attribute/index lookups (not used by
+        # the built-in prompts) fall back to str.format.
+        self._segments: Optional[List[Tuple[str, Optional[str], str, Optional[str]]]] = None
+        self._parse_error: Optional[ValueError] = None
+        try:
+            segments = list(_formatter.parse(template))
+        except ValueError as e:
+            self._parse_error = e
+        else:
+            if all(field is None or (field.isidentifier() and "{" not in spec)
+                   for _, field, spec, _ in segments):
+                self._segments = segments
+                fields = [field for _, field, _, _ in segments if field is not None]
+                self._get_field_values = itemgetter(*fields) if len(fields) > 1 else (
+                    lambda lookup: tuple(lookup[field] for field in fields))
     
     def render(self, context: Dict[str, Any]) -> str:
         """
@@ -61,42 +102,65 @@ class PromptTemplate:
         Returns:
             Rendered prompt string
         """
+        # Ensure all required variables are present
+        missing = self._variables_set.difference(context)
+        if missing:
+            missing_vars = [var for var in self.variables if var in missing]
+            logger.warning(f"Missing variables for template {self.name}: {missing_vars}")
+            # Fill missing variables with placeholders
+            for var in missing_vars:
+                context[var] = f"[{var.upper()}_NOT_AVAILABLE]"
+        
         try:
-            # Ensure all required variables are present
-            missing_vars = [var for var in self.variables if var not in context]
-            if missing_vars:
-                logger.warning(f"Missing variables for template {self.name}: {missing_vars}")
-                # Fill missing variables with placeholders
-                for var in missing_vars:
-                    context[var] = f"[{var.upper()}_NOT_AVAILABLE]"
-
-            # Provide safe defaults for formatted variables
-            numeric_defaults = {
-                'credits': 0,
-                'exploration_earnings': 0,
-                'distance_ly': 0.0,
-                'time_range': 0,
-            }
-
-            safe_context: Dict[str, Any] = {}
-            for k, v in context.items():
-                if v is None:
-                    if k in numeric_defaults:
-                        safe_context[k] = numeric_defaults[k]
-                    else:
-                        safe_context[k] = ""
-                else:
-                    safe_context[k] = v
-
-            # Ensure numeric defaults exist even if not provided
-            for k, default_v in numeric_defaults.items():
-                if k not in safe_context or safe_context[k] in (None, ""):
-                    safe_context[k] = default_v
-
-            return self.template.format(**safe_context)
-        except Exception as e:
+            if self._parse_error is not None:
+                raise self._parse_error
+            
+            if self._segments is None:
+                return self.template.format(**self._safe_context(context))
+            
+            # Fetch every field value in one call; numeric fields fall back to
+            # their defaults and any other missing field raises KeyError
+            values = iter(self._get_field_values({**_NUMERIC_DEFAULTS, **context}))
+            
+            parts = []
+            append = parts.append
+            for literal, field, spec, conversion in self._segments:
+                if literal:
+                    append(literal)
+                if field is None:
+                    continue
+                
+                value = next(values)
+                if value is None or (value == "" and field in _NUMERIC_DEFAULTS):
+                    # Provide safe defaults for formatted variables
+                    value = _NUMERIC_DEFAULTS.get(field, "")
+                if conversion:
+                    value = _formatter.convert_field(value, conversion)
+                append(format(value, spec))
+            
+            return "".join(parts)
+        except (KeyError, IndexError, AttributeError, TypeError, ValueError) as e:
+            # Missing fields, bad template syntax and values that do not
+            # match their format spec
             logger.error(f"Error rendering template {self.name}: {e}")
             return f"Error rendering prompt template: {e}"
+    
+    @staticmethod
+    def _safe_context(context: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy context with None values and missing numeric fields defaulted."""
+        safe_context: Dict[str, Any] = {}
+        for k, v in context.items():
+            if v is None:
+                safe_context[k] = _NUMERIC_DEFAULTS.get(k, "")
+            else:
+                safe_context[k] = v
+        
+        # Ensure numeric defaults exist even if not provided
+        for k, default_v in _NUMERIC_DEFAULTS.items():
+            if k not in safe_context or safe_context[k] in (None, ""):
+                safe_context[k] = default_v
+        
+        return safe_context
 
 
 class MCPPrompts:
@@ -115,6 +179,8 @@ class MCPPrompts:
             data_store: DataStore instance for accessing game data
         """
         self.data_store = data_store
+        self._context_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._context_cache_state: Optional[Tuple[int, int]] = None
         self._initialize_templates()
     
     def _initialize_templates(self):
@@ -459,6 +525,36 @@ Please provide:
                           "resource_assessment", "market_conditions", "risk_factors"]
             )
         }
+        
+        # Template IDs are fixed, so classify them once up front
+        self._prompt_types: Dict[str, str] = {
+            template_id: self._classify_prompt_type(template_id) for template_id in self.templates
+        }
+        
+        # Template-specific context builders, dispatched by template ID
+        self._context_builders = {
+            "exploration_analysis": self._build_exploration_context,
+            "trading_strategy": self._build_trading_context,
+            "combat_assessment": self._build_combat_context,
+            "mining_optimization": self._build_mining_context,
+            "mission_guidance": self._build_mission_context,
+            "engineering_progress": self._build_engineering_context,
+            "journey_review": self._build_journey_context,
+            "performance_review": self._build_performance_context,
+            "strategic_planning": self._build_strategic_context,
+        }
+        
+        # Prompt metadata never changes after this point; build the listing once
+        self._prompt_list: List[Dict[str, Any]] = [
+            {
+                "id": template_id,
+                "name": template.name,
+                "description": template.description,
+                "variables": template.variables,
+                "type": self._prompt_types[template_id]
+            }
+            for template_id, template in self.templates.items()
+        ]
     
     def list_available_prompts(self) -> List[Dict[str, Any]]:
         """
@@ -467,19 +563,18 @@ Please provide:
         Returns:
             List of prompt templates with metadata
         """
-        prompts = []
-        for template_id, template in self.templates.items():
-            prompts.append({
-                "id": template_id,
-                "name": template.name,
-                "description": template.description,
-                "variables": template.variables,
-                "type": self._get_prompt_type(template_id)
-            })
-        return prompts
+        return list(self._prompt_list)
     
     def _get_prompt_type(self, template_id: str) -> str:
         """Get prompt type from template ID."""
+        prompt_type = self._prompt_types.get(template_id)
+        if prompt_type is None:
+            prompt_type = self._classify_prompt_type(template_id)
+        return prompt_type
+    
+    @staticmethod
+    def _classify_prompt_type(template_id: str) -> str:
+        """Derive prompt type from keywords in the template ID."""
         if "exploration" in template_id:
             return PromptType.EXPLORATION.value
         elif "trading" in template_id:
@@ -512,28 +607,52 @@ Please provide:
         Returns:
             Generated prompt string
         """
+        template = self.templates.get(template_id)
+        if template is None:
+            available = ", ".join(self.templates.keys())
+            return f"Invalid template ID: {template_id}. Available templates: {available}"
+        
         try:
-            if template_id not in self.templates:
-                available = ", ".join(self.templates.keys())
-                return f"Invalid template ID: {template_id}. Available templates: {available}"
-            
-            template = self.templates[template_id]
             context = await self._build_context(template_id, time_range_hours)
-            
-            return template.render(context)
-            
         except Exception as e:
             logger.error(f"Error generating prompt {template_id}: {e}")
             return f"Error generating prompt: {e}"
+        
+        # render() reports its own formatting errors
+        return template.render(context)
     
     async def _build_context(self, template_id: str, time_range_hours: int) -> Dict[str, Any]:
-        """Build context variables for prompt generation."""
+        """
+        Build context variables for prompt generation.
+
+        Contexts are reused for repeated requests within the same second while
+        the data store reports no changes, so bursts of prompt requests do not
+        rebuild identical contexts.
+        """
+        # Recent-event windows also move with the clock, so key on the current second
+        cache_state = (self.data_store.get_version(), int(time.monotonic()))
+        if cache_state != self._context_cache_state:
+            self._context_cache.clear()
+            self._context_cache_state = cache_state
+        
+        cache_key = (template_id, time_range_hours)
+        cached = self._context_cache.get(cache_key)
+        if cached is None:
+            cached = await self._compute_context(template_id, time_range_hours)
+            if "error" in cached:
+                return cached
+            self._context_cache[cache_key] = cached
+        
+        # Rendering fills in missing variables, so hand out a copy
+        return dict(cached)
+    
+    async def _compute_context(self, template_id: str, time_range_hours: int) -> Dict[str, Any]:
+        """Compute context variables for prompt generation (uncached)."""
         try:
             # Get basic game state
             game_state = self.data_store.get_game_state()
             
             # Get recent events for analysis
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=time_range_hours)
             recent_events = self.data_store.get_recent_events(time_range_hours * 60)  # Convert hours to minutes
             
             # Build base context
@@ -550,24 +669,9 @@ Please provide:
             }
             
             # Add template-specific context
-            if template_id == "exploration_analysis":
-                context.update(await self._build_exploration_context(recent_events, time_range_hours))
-            elif template_id == "trading_strategy":
-                context.update(await self._build_trading_context(recent_events, time_range_hours))
-            elif template_id == "combat_assessment":
-                context.update(await self._build_combat_context(recent_events, time_range_hours))
-            elif template_id == "mining_optimization":
-                context.update(await self._build_mining_context(recent_events, time_range_hours))
-            elif template_id == "mission_guidance":
-                context.update(await self._build_mission_context(recent_events, time_range_hours))
-            elif template_id == "engineering_progress":
-                context.update(await self._build_engineering_context(recent_events, time_range_hours))
-            elif template_id == "journey_review":
-                context.update(await self._build_journey_context(recent_events, time_range_hours))
-            elif template_id == "performance_review":
-                context.update(await self._build_performance_context(recent_events, time_range_hours))
-            elif template_id == "strategic_planning":
-                context.update(await self._build_strategic_context(recent_events, time_range_hours))
+            context_builder = self._context_builders.get(template_id)
+            if context_builder is not None:
+                context.update(await context_builder(recent_events, time_range_hours, game_state))
             
             return context
             
@@ -575,28 +679,44 @@ Please provide:
             logger.error(f"Error building context for {template_id}: {e}")
             return {"error": str(e)}
     
-    async def _build_exploration_context(self, recent_events: List, time_range_hours: int) -> Dict[str, Any]:
+    @staticmethod
+    def _jump_stats(jump_events: List) -> Tuple[float, frozenset]:
+        """Total jump distance and unique systems for the given FSDJump events."""
+        total_distance = 0
+        systems = set()
+        for event in jump_events:
+            event_data = event.raw_event
+            total_distance += event_data.get("JumpDist", 0)
+            systems.add(event_data.get("StarSystem"))
+        systems.discard(None)  # Jumps without a StarSystem
+        
+        return total_distance, frozenset(systems)
+    
+    async def _build_exploration_context(self, recent_events: List, time_range_hours: int,
+                                         game_state: GameState) -> Dict[str, Any]:
         """Build context for exploration analysis."""
-        exploration_events = [e for e in recent_events if e.category == EventCategory.EXPLORATION]
-        jump_events = [e for e in recent_events if e.event_type == "FSDJump"]
-        scan_events = [e for e in recent_events if "Scan" in e.event_type]
+        distance_ly, systems = self._jump_stats(
+            [e for e in recent_events if e.event_type == "FSDJump"]
+        )
+        systems_visited = len(systems)
         
-        # Calculate exploration metrics
-        systems_visited = len(set(e.raw_event.get("StarSystem") for e in jump_events if "StarSystem" in e.raw_event))
-        bodies_scanned = len(scan_events)
-        distance_ly = sum(e.raw_event.get("JumpDist", 0) for e in jump_events)
-        exploration_earnings = sum(e.raw_event.get("Reward", 0) for e in exploration_events)
+        # Calculate the remaining exploration metrics in a single pass
+        bodies_scanned = 0
+        exploration_earnings = 0
+        scan_types = Counter()
+        for event in recent_events:
+            event_data = event.raw_event
+            if event.category == EventCategory.EXPLORATION:
+                exploration_earnings += event_data.get("Reward", 0)
+            if "Scan" in event.event_type:
+                bodies_scanned += 1
+                scan_types[event_data.get("ScanType", "Unknown")] += 1
         
         # Recent systems list
-        recent_systems_list = list({e.raw_event.get("StarSystem") for e in jump_events if "StarSystem" in e.raw_event})[-10:]
+        recent_systems_list = list(systems)[-10:]
         recent_systems = "\n".join(f"- {system}" for system in recent_systems_list) or "No recent jumps"
         
         # Scan summary
-        scan_types = {}
-        for event in scan_events:
-            scan_type = event.raw_event.get("ScanType", "Unknown")
-            scan_types[scan_type] = scan_types.get(scan_type, 0) + 1
-        
         scan_summary = "\n".join(f"- {scan_type}: {count}" for scan_type, count in scan_types.items()) or "No scans performed"
         
         return {
@@ -608,11 +728,12 @@ Please provide:
             "scan_summary": scan_summary
         }
     
-    async def _build_trading_context(self, recent_events: List, time_range_hours: int) -> Dict[str, Any]:
+    async def _build_trading_context(self, recent_events: List, time_range_hours: int,
+                                     game_state: GameState) -> Dict[str, Any]:
         """Build context for trading strategy."""
-        trading_events = [e for e in recent_events if e.category == EventCategory.TRADING]
-        buy_events = [e for e in trading_events if e.event_type == "MarketBuy"]
-        sell_events = [e for e in trading_events if e.event_type == "MarketSell"]
+        events_by_type = _group_events_by_type(recent_events)
+        buy_events = [e for e in events_by_type["MarketBuy"] if e.category == EventCategory.TRADING]
+        sell_events = [e for e in events_by_type["MarketSell"] if e.category == EventCategory.TRADING]
         
         # Calculate trading metrics
         total_profit = sum(e.raw_event.get("Profit", 0) for e in sell_events)
@@ -625,7 +746,7 @@ Please provide:
         cargo_capacity = loadout_events[0].raw_event.get("CargoCapacity", 0) if loadout_events else 0
         
         # Best trades
-        best_trades_list = sorted(sell_events, key=lambda x: x.raw_event.get("Profit", 0), reverse=True)[:5]
+        best_trades_list = heapq.nlargest(5, sell_events, key=lambda x: x.raw_event.get("Profit", 0))
         best_trades = "\n".join(
             f"- {e.raw_event.get('Type', 'Unknown')}: {e.raw_event.get('Profit', 0):,} CR profit"
             for e in best_trades_list
@@ -644,12 +765,13 @@ Please provide:
             "market_opportunities": market_opportunities
         }
     
-    async def _build_combat_context(self, recent_events: List, time_range_hours: int) -> Dict[str, Any]:
+    async def _build_combat_context(self, recent_events: List, time_range_hours: int,
+                                    game_state: GameState) -> Dict[str, Any]:
         """Build context for combat assessment."""
-        combat_events = [e for e in recent_events if e.category == EventCategory.COMBAT]
-        bounty_events = [e for e in combat_events if e.event_type == "Bounty"]
-        bond_events = [e for e in combat_events if e.event_type == "FactionKillBond"]
-        death_events = [e for e in combat_events if e.event_type == "Died"]
+        events_by_type = _group_events_by_type(recent_events)
+        bounty_events = [e for e in events_by_type["Bounty"] if e.category == EventCategory.COMBAT]
+        bond_events = [e for e in events_by_type["FactionKillBond"] if e.category == EventCategory.COMBAT]
+        death_events = [e for e in events_by_type["Died"] if e.category == EventCategory.COMBAT]
         
         # Calculate combat metrics
         bounties_earned = sum(e.raw_event.get("Reward", 0) for e in bounty_events)
@@ -674,15 +796,21 @@ Please provide:
             "ship_loadout": ship_loadout
         }
     
-    async def _build_mining_context(self, recent_events: List, time_range_hours: int) -> Dict[str, Any]:
+    async def _build_mining_context(self, recent_events: List, time_range_hours: int,
+                                    game_state: GameState) -> Dict[str, Any]:
         """Build context for mining optimization."""
-        mining_events = [e for e in recent_events if e.category == EventCategory.MINING]
-        collection_events = [e for e in mining_events if e.event_type == "MaterialCollected"]
+        events_by_type = _group_events_by_type(recent_events)
+        collection_events = [e for e in events_by_type["MaterialCollected"] if e.category == EventCategory.MINING]
         
-        # Calculate mining metrics
+        # Calculate mining metrics; earnings and material counts share one pass
         materials_collected = len(collection_events)
-        asteroids_mined = len([e for e in mining_events if e.event_type == "AsteroidCracked"])
-        mining_earnings = sum(e.raw_event.get("MarketValue", 0) for e in collection_events)
+        asteroids_mined = sum(1 for e in events_by_type["AsteroidCracked"] if e.category == EventCategory.MINING)
+        mining_earnings = 0
+        material_types = Counter()
+        for event in collection_events:
+            event_data = event.raw_event
+            mining_earnings += event_data.get("MarketValue", 0)
+            material_types[event_data.get("Name", "Unknown")] += 1
         avg_value_per_ton = mining_earnings / max(materials_collected, 1)
         
         # Get cargo info
@@ -696,11 +824,6 @@ Please provide:
         cargo_capacity = loadout_events[0].raw_event.get("CargoCapacity", 0) if loadout_events else 0
         
         # Materials summary
-        material_types = {}
-        for event in collection_events:
-            material = event.raw_event.get("Name", "Unknown")
-            material_types[material] = material_types.get(material, 0) + 1
-        
         materials_summary = "\n".join(f"- {material}: {count}" for material, count in material_types.items()) or "No materials collected"
         
         # Mining equipment (placeholder)
@@ -717,12 +840,13 @@ Please provide:
             "mining_equipment": mining_equipment
         }
     
-    async def _build_mission_context(self, recent_events: List, time_range_hours: int) -> Dict[str, Any]:
+    async def _build_mission_context(self, recent_events: List, time_range_hours: int,
+                                     game_state: GameState) -> Dict[str, Any]:
         """Build context for mission guidance."""
-        mission_events = [e for e in recent_events if e.category == EventCategory.MISSION]
-        completed_events = [e for e in mission_events if e.event_type == "MissionCompleted"]
-        failed_events = [e for e in mission_events if e.event_type == "MissionFailed"]
-        accepted_events = [e for e in mission_events if e.event_type == "MissionAccepted"]
+        events_by_type = _group_events_by_type(recent_events)
+        completed_events = [e for e in events_by_type["MissionCompleted"] if e.category == EventCategory.MISSION]
+        failed_events = [e for e in events_by_type["MissionFailed"] if e.category == EventCategory.MISSION]
+        accepted_events = [e for e in events_by_type["MissionAccepted"] if e.category == EventCategory.MISSION]
         
         # Calculate mission metrics
         missions_completed = len(completed_events)
@@ -735,10 +859,7 @@ Please provide:
         active_missions = "Check mission panel for current active missions"
         
         # Mission types
-        mission_types = {}
-        for event in accepted_events:
-            mission_type = event.raw_event.get("Name", "Unknown")
-            mission_types[mission_type] = mission_types.get(mission_type, 0) + 1
+        mission_types = Counter(event.raw_event.get("Name", "Unknown") for event in accepted_events)
         
         mission_types_summary = "\n".join(f"- {mission_type}: {count}" for mission_type, count in mission_types.items()) or "No missions accepted"
         
@@ -757,13 +878,16 @@ Please provide:
             "faction_standings": faction_standings
         }
     
-    async def _build_engineering_context(self, recent_events: List, time_range_hours: int) -> Dict[str, Any]:
+    async def _build_engineering_context(self, recent_events: List, time_range_hours: int,
+                                         game_state: GameState) -> Dict[str, Any]:
         """Build context for engineering progress."""
         engineering_events = [e for e in recent_events if e.category == EventCategory.ENGINEERING]
         
         # Engineering metrics (placeholders as Elite Dangerous engineering events vary)
         engineer_standings = "Check engineer progress in right panel"
-        engineers_visited = len(set(e.raw_event.get("Engineer") for e in engineering_events if "Engineer" in e.raw_event))
+        engineers = {e.raw_event.get("Engineer") for e in engineering_events}
+        engineers.discard(None)
+        engineers_visited = len(engineers)
         modifications_applied = len([e for e in engineering_events if e.event_type == "EngineerContribution"])
         materials_used = "Review recent material usage for engineering"
         ship_modifications = "Check current ship modifications in outfitting"
@@ -780,16 +904,20 @@ Please provide:
             "blueprint_progress": blueprint_progress
         }
     
-    async def _build_journey_context(self, recent_events: List, time_range_hours: int) -> Dict[str, Any]:
+    async def _build_journey_context(self, recent_events: List, time_range_hours: int,
+                                     game_state: GameState) -> Dict[str, Any]:
         """Build context for journey review."""
-        jump_events = [e for e in recent_events if e.event_type == "FSDJump"]
-        dock_events = [e for e in recent_events if e.event_type == "Docked"]
+        events_by_type = _group_events_by_type(recent_events)
+        jump_events = events_by_type["FSDJump"]
+        dock_events = events_by_type["Docked"]
         
         # Journey metrics
         total_jumps = len(jump_events)
-        total_distance = sum(e.raw_event.get("JumpDist", 0) for e in jump_events)
-        systems_visited = len(set(e.raw_event.get("StarSystem") for e in jump_events if "StarSystem" in e.raw_event))
-        stations_visited = len(set(e.raw_event.get("StationName") for e in dock_events if "StationName" in e.raw_event))
+        total_distance, systems = self._jump_stats(jump_events)
+        systems_visited = len(systems)
+        stations = {e.raw_event.get("StationName") for e in dock_events}
+        stations.discard(None)
+        stations_visited = len(stations)
         
         avg_jump_distance = total_distance / max(total_jumps, 1)
         
@@ -799,13 +927,12 @@ Please provide:
         # Route analysis
         route_analysis = f"Traveled through {systems_visited} unique systems with {total_jumps} total jumps"
         
-        # Notable events
-        notable_events_list = []
-        for event in recent_events:
-            if event.category in [EventCategory.EXPLORATION, EventCategory.COMBAT]:
-                notable_events_list.append(f"- {event.summary}")
-        
-        notable_events = "\n".join(notable_events_list[:5]) or "No notable events during journey"
+        # Notable events (stop scanning once the first five are found)
+        notable_events = "\n".join(islice(
+            (f"- {event.summary}" for event in recent_events
+             if event.category in (EventCategory.EXPLORATION, EventCategory.COMBAT)),
+            5
+        )) or "No notable events during journey"
         
         # Efficiency metrics (placeholders)
         fuel_efficiency = "Analyze fuel usage patterns"
@@ -824,26 +951,30 @@ Please provide:
             "navigation_time": navigation_time
         }
     
-    async def _build_performance_context(self, recent_events: List, time_range_hours: int) -> Dict[str, Any]:
+    async def _build_performance_context(self, recent_events: List, time_range_hours: int,
+                                         game_state: GameState) -> Dict[str, Any]:
         """Build context for performance review."""
-        # Calculate earnings and spending
-        earnings_events = [e for e in recent_events if "Reward" in e.raw_event and e.raw_event["Reward"] > 0]
-        spending_events = [e for e in recent_events if "Cost" in e.raw_event and e.raw_event["Cost"] > 0]
+        # Calculate earnings, spending and activity breakdown in one pass
+        credits_earned = 0
+        credits_spent = 0
+        activity_counts = Counter()
+        for event in recent_events:
+            event_data = event.raw_event
+            reward = event_data.get("Reward", 0)
+            if reward > 0:
+                credits_earned += reward
+            cost = event_data.get("Cost", 0)
+            if cost > 0:
+                credits_spent += cost
+            activity_counts[event.category.value] += 1
         
-        credits_earned = sum(e.raw_event.get("Reward", 0) for e in earnings_events)
-        credits_spent = sum(e.raw_event.get("Cost", 0) for e in spending_events)
         net_profit = credits_earned - credits_spent
         credits_per_hour = credits_earned / max(time_range_hours, 1)
         
         # Get current total assets (placeholder)
-        total_assets = self.data_store.get_game_state().credits
+        total_assets = game_state.credits
         
         # Activity breakdown
-        activity_counts = {}
-        for event in recent_events:
-            category = event.category.value
-            activity_counts[category] = activity_counts.get(category, 0) + 1
-        
         activity_breakdown = "\n".join(f"- {activity}: {count} events" for activity, count in activity_counts.items()) or "No recent activity"
         
         # Efficiency metrics
@@ -865,16 +996,14 @@ Please provide:
             "achievements": achievements
         }
     
-    async def _build_strategic_context(self, recent_events: List, time_range_hours: int) -> Dict[str, Any]:
+    async def _build_strategic_context(self, recent_events: List, time_range_hours: int,
+                                       game_state: GameState) -> Dict[str, Any]:
         """Build context for strategic planning."""
         # Activity focus analysis
-        activity_counts = {}
-        for event in recent_events:
-            category = event.category.value
-            activity_counts[category] = activity_counts.get(category, 0) + 1
+        activity_counts = Counter(event.category.value for event in recent_events)
         
-        top_activity = max(activity_counts, key=activity_counts.get) if activity_counts else "none"
-        activity_focus = f"Primary focus: {top_activity} ({activity_counts.get(top_activity, 0)} events)"
+        top_activity, top_count = activity_counts.most_common(1)[0] if activity_counts else ("none", 0)
+        activity_focus = f"Primary focus: {top_activity} ({top_count} events)"
         
         # Current objectives (placeholder)
         current_objectives = "Analyze mission log and personal goals"
@@ -883,7 +1012,6 @@ Please provide:
         opportunities = "Review galaxy map for current opportunities"
         
         # Resource assessment
-        game_state = self.data_store.get_game_state()
         resource_assessment = f"Credits: {game_state.credits:,} CR\nShip: {game_state.current_ship}\nLocation: {game_state.current_system}"
         
         # Market conditions (placeholder)
@@ -14,6 +14,8 @@ from typing import Dict, Any, Optional, List, Tuple
 from urllib.parse import urlparse, parse_qs
 from enum import Enum
 import hashlib
+import heapq
+from operator import itemgetter
 
 try:
     from ..utils.data_store import DataStore
@@ -476,8 +478,8 @@ class MCPResources:
                     category_distribution[category] = 0
                 category_distribution[category] += 1
             
-            # Sort distributions
-            top_types = sorted(type_distribution.items(), key=lambda x: x[1], reverse=True)[:10]
+            # Top event types (partial selection instead of sorting every type)
+            top_types = heapq.nlargest(10, type_distribution.items(), key=itemgetter(1))
             
             return {
                 "total_events": stats["total_events"],
@@ -9,6 +9,7 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional, Set
 from enum import Enum
+from itertools import chain
 
 try:
     from ..journal.events import EventCategory, ProcessedEvent
@@ -647,12 +648,12 @@ class MCPTools:
         )
         material_events = self.data_store.query_events(material_filter)
 
-        # Combine events for comprehensive analysis
-        events = mining_events + material_events
+        # Combine events for comprehensive analysis without copying both lists
+        events = chain(mining_events, material_events)
         
         summary = {
             "activity_type": "mining",
-            "total_events": len(events),
+            "total_events": len(mining_events) + len(material_events),
             # Separate commodities (sellable cargo from refinery) from materials (engineering resources)
             "commodities_refined": {},  # From MiningRefined events - what users want to see
             "raw_materials_collected": {},  # From MaterialCollected events - for engineering
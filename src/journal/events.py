@@ -6,6 +6,7 @@ and data extraction for all major Elite Dangerous journal event types.
 """
 
 import logging
+from collections import Counter
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, Any, Optional, List
@@ -927,21 +928,23 @@ def get_event_statistics(events: List[Dict[str, Any]]) -> Dict[str, Any]:
         return stats
     
     processed_events = []
+    category_counts = Counter()
+    event_type_counts = Counter()
     for event in events:
         processed = processor.process_event(event)
         processed_events.append(processed)
         
-        # Count by category
-        category_name = processed.category.value
-        stats["categories"][category_name] = stats["categories"].get(category_name, 0) + 1
-        
-        # Count by event type
-        stats["event_types"][processed.event_type] = stats["event_types"].get(processed.event_type, 0) + 1
+        # Count by category and event type
+        category_counts[processed.category.value] += 1
+        event_type_counts[processed.event_type] += 1
         
         # Count invalid events
         if not processed.is_valid:
             stats["invalid_events"] += 1
     
+    stats["categories"] = dict(category_counts)
+    stats["event_types"] = dict(event_type_counts)
+    
     # Get time range - normalize all timestamps to remove timezone info for consistency
     if processed_events:
         timestamps = [e.timestamp.replace(tzinfo=None) for e in processed_events]
@@ -6,6 +6,7 @@ watchdog file system events with position tracking and rotation handling.
 
 import asyncio
 import logging
+import os
 from pathlib import Path
 from typing import Callable, Dict, Optional, Set
 from datetime import datetime, timedelta, timezone
@@ -43,6 +44,7 @@ class JournalEventHandler(FileSystemEventHandler):
         self.callback = callback
         self.parser = parser
         self.event_loop = event_loop
+        # Keyed by os.fspath() of the journal path
         self.current_positions: Dict[str, int] = {}
         self.monitored_files: Set[str] = set()
         # Initialize to past time so first status check won't be throttled
@@ -60,13 +62,15 @@ class JournalEventHandler(FileSystemEventHandler):
         if event.is_directory:
             return
         
-        file_path = Path(event.src_path)
+        # The game rewrites many other files here (Cargo.json, Market.json, ...);
+        # check the bare name before building a Path for files we handle
+        name = os.path.basename(event.src_path)
         
         # Handle different file types
-        if file_path.name.startswith('Journal.') and file_path.name.endswith('.log'):
-            self._schedule_coroutine(self._handle_journal_modification(file_path))
-        elif file_path.name == 'Status.json':
-            self._schedule_coroutine(self._handle_status_modification(file_path))
+        if name.startswith('Journal.') and name.endswith('.log'):
+            self._schedule_coroutine(self._handle_journal_modification(Path(event.src_path)))
+        elif name == 'Status.json':
+            self._schedule_coroutine(self._handle_status_modification(Path(event.src_path)))
     
     def on_created(self, event):
         """
@@ -78,11 +82,11 @@ class JournalEventHandler(FileSystemEventHandler):
         if event.is_directory:
             return
         
-        file_path = Path(event.src_path)
+        name = os.path.basename(event.src_path)
         
-        if file_path.name.startswith('Journal.') and file_path.name.endswith('.log'):
-            logger.info(f"New journal file detected: {file_path.name}")
-            self._schedule_coroutine(self._handle_journal_creation(file_path))
+        if name.startswith('Journal.') and name.endswith('.log'):
+            logger.info(f"New journal file detected: {name}")
+            self._schedule_coroutine(self._handle_journal_creation(Path(event.src_path)))
     
     def _schedule_coroutine(self, coro):
         """
@@ -105,7 +109,7 @@ class JournalEventHandler(FileSystemEventHandler):
             file_path: Path to modified journal file
         """
         try:
-            file_key = str(file_path)
+            file_key = os.fspath(file_path)
             
             # Get last position for this file
             last_position = self.current_positions.get(file_key, 0)
@@ -135,7 +139,7 @@ class JournalEventHandler(FileSystemEventHandler):
             file_path: Path to newly created journal file
         """
         try:
-            file_key = str(file_path)
+            file_key = os.fspath(file_path)
             
             # Add to monitored files
             self.monitored_files.add(file_key)
@@ -367,7 +371,7 @@ class JournalMonitor:
             journal_files = self.parser.find_journal_files(include_backups=False)
             
             for file_path in journal_files:
-                file_key = str(file_path)
+                file_key = os.fspath(file_path)
                 self.event_handler.monitored_files.add(file_key)
                 
                 # For existing files, set position to end to avoid re-processing
@@ -394,7 +398,7 @@ class JournalMonitor:
             latest_journal = self.parser.get_latest_journal(include_backups=False)
             
             if latest_journal:
-                file_key = str(latest_journal)
+                file_key = os.fspath(latest_journal)
                 
                 # Read existing entries
                 entries, position = self.parser.read_journal_file(latest_journal)
@@ -4,17 +4,79 @@ Handles discovery, reading, and parsing of Elite Dangerous journal files
 with robust error handling and performance optimization.
 """
 
-import glob
 import logging
+import os
 import re
+import stat
+import sys
+import time
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import orjson
 
 logger = logging.getLogger(__name__)
 
+# Coarsest directory mtime resolution we expect (FAT/exFAT use 2 seconds)
+_DIRECTORY_MTIME_GRANULARITY_NS = 2_000_000_000
+
+# Valid journal filenames: support both legacy and ISO-like formats
+# Journal.YYYYMMDDHHMMSS.NN.log[.backup] / Journal.YYYY-MM-DDTHHMMSS.NN.log[.backup]
+# The timestamp is captured as 'legacy' (14 digits) or 'iso' for sorting
+_JOURNAL_FILENAME_RE = re.compile(
+    r'^Journal\.(?:(?P<legacy>\d{14})|(?P<iso>\d{4}-\d{2}-\d{2}T\d{6}))\.\d{2}\.log(?:\.backup)?$'
+)
+_FILENAME_TIMESTAMP_RE = re.compile(r'Journal\.(?:(?P<iso>\d{4}-\d{2}-\d{2}T\d{6})|(?P<legacy>\d{14}))\.')
+
+
+@lru_cache(maxsize=1024)
+def _parse_journal_filename_timestamp(filename: str) -> datetime:
+    """
+    Parse timestamp from a journal filename.
+
+    Cached at module level so every parser instance shares the results;
+    journal names never change meaning once written.
+
+    Args:
+        filename: Journal file name
+
+    Returns:
+        datetime: Extracted timestamp (epoch if parsing fails)
+    """
+    try:
+        # Patterns:
+        # 1) Journal.YYYYMMDDHHMMSS.NN.log[.backup]
+        # 2) Journal.YYYY-MM-DDTHHMMSS.NN.log[.backup]
+
+        # Fast path: the names are fixed-width, so slice the digits out directly
+        if filename.startswith("Journal."):
+            stamp = filename[8:].partition(".")[0]
+            if len(stamp) == 17 and stamp[4] == "-" and stamp[7] == "-" and stamp[10] == "T":
+                stamp = stamp[0:4] + stamp[5:7] + stamp[8:10] + stamp[11:]
+            if len(stamp) == 14 and stamp.isascii() and stamp.isdigit():
+                return datetime(
+                    int(stamp[0:4]), int(stamp[4:6]), int(stamp[6:8]),
+                    int(stamp[8:10]), int(stamp[10:12]), int(stamp[12:14])
+                )
+
+        # Fall back to one regex search for anything that does not fit the
+        # fixed layout, with ISO-like and legacy compact forms as named groups
+        match = _FILENAME_TIMESTAMP_RE.search(filename)
+        if match:
+            if match.group('iso'):
+                return datetime.strptime(match.group('iso'), "%Y-%m-%dT%H%M%S")
+            return datetime.strptime(match.group('legacy'), "%Y%m%d%H%M%S")
+
+        logger.warning("Could not extract timestamp from filename: %s", filename)
+        return datetime.fromtimestamp(0)  # Epoch as fallback
+
+    except Exception as e:
+        logger.warning("Error parsing timestamp from %s: %s", filename, e)
+        return datetime.fromtimestamp(0)  # Epoch as fallback
+
 
 class JournalParser:
     """
@@ -37,6 +99,7 @@ class JournalParser:
         """
         self.journal_path = Path(journal_path)
         self.encoding = "utf-8"
+        self._files_cache: Dict[bool, Tuple[int, List[Path]]] = {}
         
         logger.info(f"Initialized journal parser for: {self.journal_path}")
     
@@ -51,64 +114,87 @@ class JournalParser:
             List[Path]: Sorted list of journal file paths
         """
         try:
-            if not self.journal_path.exists():
-                logger.warning(f"Journal directory does not exist: {self.journal_path}")
-                return []
-            
-            # Pattern for journal files: Journal.YYYYMMDDHHMMSS.NN.log
-            patterns = ["Journal.*.log"]
-            if include_backups:
-                patterns.append("Journal.*.log.backup")
-            
-            journal_files = []
-            for pattern in patterns:
-                search_path = self.journal_path / pattern
-                found_files = glob.glob(str(search_path))
-                journal_files.extend([Path(f) for f in found_files])
-            
-            # Filter files to only include those with valid journal filename patterns
-            valid_journal_files = []
-            for file_path in journal_files:
-                if self._is_valid_journal_filename(file_path):
-                    valid_journal_files.append(file_path)
-                else:
-                    logger.debug(f"Skipping file with invalid journal pattern: {file_path.name}")
-            
-            # Sort by timestamp extracted from filename (newest first)
-            valid_journal_files.sort(key=self._extract_timestamp_from_filename, reverse=True)
-            
-            logger.debug(f"Found {len(valid_journal_files)} valid journal files")
-            return valid_journal_files
+            valid_journal_files = self._sorted_journal_files(include_backups)
+            logger.debug("Found %d valid journal files", len(valid_journal_files))
+            return list(valid_journal_files)
             
         except Exception as e:
             logger.error(f"Error finding journal files: {e}")
             return []
     
-    def _is_valid_journal_filename(self, file_path: Path) -> bool:
+    def _sorted_journal_files(self, include_backups: bool) -> List[Path]:
         """
-        Check if filename matches valid journal pattern.
+        Journal files sorted newest first, reusing the previous scan while the
+        directory is unchanged.
         
         Args:
-            file_path: Path to check
+            include_backups: Whether to include .log.backup files
             
         Returns:
-            bool: True if filename is valid journal pattern
+            List[Path]: Shared sorted list; callers must not modify it
         """
-        filename = file_path.name
+        try:
+            directory_mtime = os.stat(self.journal_path).st_mtime_ns
+        except FileNotFoundError:
+            logger.warning(f"Journal directory does not exist: {self.journal_path}")
+            return []
+        
+        cached = self._files_cache.get(include_backups)
+        if cached is not None and cached[0] == directory_mtime:
+            return cached[1]
+        scan_started = time.time_ns()
         
-        # Valid patterns: support both legacy and ISO-like formats
-        patterns = [
-            r'^Journal\.\d{14}\.\d{2}\.log$',
-            r'^Journal\.\d{14}\.\d{2}\.log\.backup$',
-            r'^Journal\.\d{4}-\d{2}-\d{2}T\d{6}\.\d{2}\.log$',
-            r'^Journal\.\d{4}-\d{2}-\d{2}T\d{6}\.\d{2}\.log\.backup$'
-        ]
+        # Sort by timestamp extracted from filename (newest first)
+        timestamped_files = self._scan_journal_files(include_backups)
+        timestamped_files.sort(key=itemgetter(0), reverse=True)
+        journal_files = [Path(file_path) for _, file_path in timestamped_files]
         
-        for pattern in patterns:
-            if re.match(pattern, filename):
-                return True
+        # Only cache when the directory mtime is safely in the past; a change
+        # within the filesystem timestamp granularity would not bump it
+        if scan_started - directory_mtime > _DIRECTORY_MTIME_GRANULARITY_NS:
+            self._files_cache[include_backups] = (directory_mtime, journal_files)
         
-        return False
+        return journal_files
+    
+    def _scan_journal_files(self, include_backups: bool) -> List[Tuple[str, str]]:
+        """
+        Scan the journal directory for valid journal files (unsorted).
+        
+        Args:
+            include_backups: Whether to include .log.backup files
+            
+        Returns:
+            List[Tuple[str, str]]: (sort key, path string) pairs in directory order; the
+            key is the filename timestamp as YYYYMMDDHHMMSS, so comparing keys
+            as strings orders files chronologically without parsing dates.
+            Callers build Path objects only for the files they return.
+        """
+        # Pattern for journal files: Journal.YYYYMMDDHHMMSS.NN.log
+        suffixes = (".log", ".log.backup") if include_backups else (".log",)
+        
+        # Single directory pass: filter by name, then validate the pattern and
+        # capture the timestamp digits with one regex match per file
+        timestamped_files = []
+        match_filename = _JOURNAL_FILENAME_RE.match
+        with os.scandir(self.journal_path) as dir_entries:
+            for dir_entry in dir_entries:
+                name = dir_entry.name
+                if not (name.startswith("Journal.") and name.endswith(suffixes)):
+                    continue
+                if not dir_entry.is_file():
+                    continue
+                
+                match = match_filename(name)
+                if match is None:
+                    logger.debug("Skipping file with invalid journal pattern: %s", name)
+                    continue
+                
+                sort_key = match.group('legacy')
+                if sort_key is None:
+                    sort_key = match.group('iso').replace('-', '').replace('T', '')
+                timestamped_files.append((sort_key, dir_entry.path))
+        
+        return timestamped_files
     
     def get_latest_journal(self, include_backups: bool = False) -> Optional[Path]:
         """
@@ -121,13 +207,13 @@ class JournalParser:
             Optional[Path]: Path to latest journal file, or None if not found
         """
         try:
-            journal_files = self.find_journal_files(include_backups=include_backups)
+            journal_files = self._sorted_journal_files(include_backups)
             
             if not journal_files:
                 logger.warning("No journal files found")
                 return None
             
-            latest_file = journal_files[0]  # Already sorted newest first
+            latest_file = journal_files[0]
             logger.info(f"Latest journal file: {latest_file.name}")
             return latest_file
             
@@ -149,65 +235,85 @@ class JournalParser:
         if not isinstance(timestamp_value, str):
             return False
         
-        # Must not be empty
-        if not timestamp_value.strip():
+        # Must match basic ISO 8601 layout (simplified check)
+        # Elite Dangerous uses fixed-width YYYY-MM-DDTHH:MM:SSZ (Z optional)
+        length = len(timestamp_value)
+        if length != 19 and not (length == 20 and timestamp_value[19] == 'Z'):
             return False
-        
-        # Must match basic ISO 8601 pattern (simplified check)
-        # Elite Dangerous uses: YYYY-MM-DDTHH:MM:SSZ format
-        iso_pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z?$'
-        if not re.match(iso_pattern, timestamp_value):
+        if (timestamp_value[4] != '-' or timestamp_value[7] != '-' or timestamp_value[10] != 'T'
+                or timestamp_value[13] != ':' or timestamp_value[16] != ':'):
             return False
         
-        return True
+        digits = (timestamp_value[0:4] + timestamp_value[5:7] + timestamp_value[8:10]
+                  + timestamp_value[11:13] + timestamp_value[14:16] + timestamp_value[17:19])
+        return digits.isascii() and digits.isdigit()
     
-    def parse_journal_entry(self, line: str) -> Optional[Dict]:
+    def parse_journal_entry(self, line: Union[str, bytes]) -> Optional[Dict]:
         """
         Parse a single journal entry using orjson for performance.
 
         Args:
-            line: Raw JSON line from journal file
+            line: Raw JSON line from journal file (text or raw bytes)
             
         Returns:
             Optional[Dict]: Parsed journal entry, or None if invalid
         """
         try:
-            # Strip whitespace and skip empty lines
-            line = line.strip()
-            if not line:
+            # Skip empty lines; orjson tolerates surrounding whitespace itself,
+            # so non-blank lines are passed through without a strip() copy
+            if not line or line.isspace():
                 return None
             
             # Parse JSON using orjson for performance
-            entry = orjson.loads(line)
-            
-            # Validate basic structure
-            if not isinstance(entry, dict):
-                logger.warning(f"Journal entry is not a dictionary: {type(entry)}")
-                return None
-            
-            # Ensure timestamp exists and is valid
-            if 'timestamp' not in entry:
-                logger.warning("Journal entry missing timestamp")
-                return None
-            
-            if not self._is_valid_timestamp(entry['timestamp']):
-                logger.warning(f"Journal entry has invalid timestamp format: {entry.get('timestamp')}")
-                return None
-            
-            # Ensure event type exists
-            if 'event' not in entry:
-                logger.warning("Journal entry missing event type")
-                return None
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                if not isinstance(line, bytes):
+                    raise
+                # Raw bytes may not be valid UTF-8; retry with replacement characters
+                line = line.decode(self.encoding, errors='replace')
+                entry = orjson.loads(line)
             
-            return entry
+            return self._validate_entry(entry)
             
         except orjson.JSONDecodeError as e:
-            logger.warning(f"JSON decode error: {e} for line: {line[:100]}...")
+            logger.warning("JSON decode error: %s for line: %.100s...", e, line)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error parsing journal entry: {e}")
+            logger.error("Unexpected error parsing journal entry: %s", e)
             return None
     
+    def _validate_entry(self, entry) -> Optional[Dict]:
+        """
+        Check the structure of a decoded journal entry.
+
+        Args:
+            entry: Value decoded from one journal line
+            
+        Returns:
+            Optional[Dict]: The entry, or None if it is not a valid journal entry
+        """
+        # Validate basic structure
+        if not isinstance(entry, dict):
+            logger.warning("Journal entry is not a dictionary: %s", type(entry))
+            return None
+        
+        # Ensure timestamp exists and is valid
+        if 'timestamp' not in entry:
+            logger.warning("Journal entry missing timestamp")
+            return None
+        
+        if not self._is_valid_timestamp(entry['timestamp']):
+            logger.warning("Journal entry has invalid timestamp format: %s", entry.get('timestamp'))
+            return None
+        
+        # Ensure event type exists
+        if 'event' not in entry:
+            logger.warning("Journal entry missing event type")
+            return None
+        
+        return entry
+    
     def read_journal_file(self, file_path: Path, start_position: int = 0) -> Tuple[List[Dict], int]:
         """
         Read and parse entire journal file from specified position.
@@ -220,37 +326,118 @@ class JournalParser:
             Tuple[List[Dict], int]: (parsed entries, final file position)
         """
         try:
-            if not file_path or not Path(file_path).exists():
+            if not file_path:
                 logger.error(f"Journal file does not exist: {file_path}")
                 return [], start_position
             
-            entries = []
+            # Let open() report a missing file rather than stat-ing it first
+            try:
+                f = open(file_path, 'rb')
+            except FileNotFoundError:
+                logger.error(f"Journal file does not exist: {file_path}")
+                return [], start_position
             
-            with open(file_path, 'r', encoding=self.encoding, errors='replace') as f:
-                # Seek to start position if specified
-                if start_position > 0:
-                    f.seek(start_position)
+            with f:
+                file_size = os.fstat(f.fileno()).st_size
+                if start_position >= file_size:
+                    # Nothing new to read (also covers empty/truncated files)
+                    return [], start_position
                 
-                line_count = 0
-                for line in f:
+                # Take the new data as one block with a single read
+                f.seek(start_position)
+                data = f.read(file_size - start_position)
+            
+            # Parse up to the last complete line
+            complete_length = data.rfind(b'\n') + 1
+            tail = data[complete_length:]
+            if tail:
+                data = data[:complete_length]
+            lines = data.splitlines()
+            entries = self._parse_journal_lines(lines)
+            line_count = len(lines)
+            
+            # A final line without a newline is consumed only if it already
+            # decodes to a JSON object; a partial line (still being written) is
+            # left for the next read. The decoded object is kept, not re-parsed.
+            final_position = file_size
+            if tail.strip():
+                tail_entry = self._decode_complete_line(tail)
+                if tail_entry is None:
+                    final_position = start_position + complete_length
+                else:
                     line_count += 1
-                    entry = self.parse_journal_entry(line)
-                    if entry:
-                        entries.append(entry)
-                
-                # Get final file position
-                final_position = f.tell()
+                    tail_entry = self._validate_entry(tail_entry)
+                    if tail_entry is not None:
+                        if type(tail_entry['event']) is str:
+                            tail_entry['event'] = sys.intern(tail_entry['event'])
+                        entries.append(tail_entry)
             
-            logger.info(f"Read {len(entries)} valid entries from {line_count} lines in {file_path.name}")
+            logger.info("Read %d valid entries from %d lines in %s", len(entries), line_count, file_path.name)
             return entries, final_position
             
-        except UnicodeDecodeError as e:
-            logger.error(f"Encoding error reading {file_path}: {e}")
-            return [], start_position
         except Exception as e:
             logger.error(f"Error reading journal file {file_path}: {e}")
             return [], start_position
     
+    @staticmethod
+    def _decode_complete_line(line: bytes) -> Optional[Dict]:
+        """Decode a line without a trailing newline if it is already a whole JSON object."""
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            return None
+        return entry if isinstance(entry, dict) else None
+    
+    def _parse_journal_lines(self, lines: List[bytes]) -> List[Dict]:
+        """
+        Parse a batch of raw journal lines, keeping only valid entries.
+
+        Well-formed entries are decoded and validated inline; anything that
+        fails goes through parse_journal_entry, which handles blank lines,
+        invalid UTF-8 and logs why the entry was rejected.
+
+        Args:
+            lines: Raw journal lines without line terminators
+
+        Returns:
+            List[Dict]: Valid parsed entries in file order
+        """
+        loads = orjson.loads
+        decode_error = orjson.JSONDecodeError
+        is_valid_timestamp = self._is_valid_timestamp
+        intern = sys.intern
+        entries = []
+        append = entries.append
+        
+        for line in lines:
+            entry = None
+            
+            # Journal lines are single JSON objects; a successful decode of
+            # something framed by braces is always a dict
+            if line[:1] == b'{' and line[-1:] == b'}':
+                try:
+                    entry = loads(line)
+                except decode_error:
+                    pass
+                else:
+                    if not ('event' in entry and is_valid_timestamp(entry.get('timestamp'))):
+                        entry = None
+            
+            if entry is None:
+                # Slow path for the rare bad line
+                entry = self.parse_journal_entry(line)
+                if not entry:
+                    continue
+            
+            # Event names come from a small fixed set; share one string object
+            # per name so stored entries do not each carry a copy
+            event = entry['event']
+            if type(event) is str:
+                entry['event'] = intern(event)
+            append(entry)
+        
+        return entries
+    
     def read_journal_file_incremental(self, file_path: Path, last_position: int) -> Tuple[List[Dict], int]:
         """
         Read only new entries from journal file since last position.
@@ -263,8 +450,8 @@ class JournalParser:
             Tuple[List[Dict], int]: (new entries, current file position)
         """
         try:
-            if not file_path.exists():
-                return [], last_position
+            # A missing file is reported by read_journal_file, which returns
+            # last_position unchanged
 
             # REMOVED: File size check that causes race condition (Issue #12)
             # The previous implementation checked if current_size <= last_position
@@ -280,7 +467,7 @@ class JournalParser:
             new_entries, new_position = self.read_journal_file(file_path, last_position)
 
             if new_entries:
-                logger.debug(f"Read {len(new_entries)} new entries from {file_path.name}")
+                logger.debug("Read %d new entries from %s", len(new_entries), file_path.name)
 
             return new_entries, new_position
 
@@ -311,9 +498,10 @@ class JournalParser:
                 logger.debug("Status.json file not found")
                 return None
             
-            with open(status_file, 'r', encoding=self.encoding) as f:
-                content = f.read().strip()
-                if not content:
+            # orjson parses UTF-8 bytes directly and tolerates surrounding whitespace
+            with open(status_file, 'rb') as f:
+                content = f.read()
+                if not content or content.isspace():
                     return None
                 
                 status_data = orjson.loads(content)
@@ -342,31 +530,7 @@ class JournalParser:
         Returns:
             datetime: Extracted timestamp (epoch if parsing fails)
         """
-        try:
-            # Patterns:
-            # 1) Journal.YYYYMMDDHHMMSS.NN.log[.backup]
-            # 2) Journal.YYYY-MM-DDTHHMMSS.NN.log[.backup]
-            filename = file_path.name
-
-            # Extract timestamp part using regex - handles both formats
-            # Try ISO-like format first: Journal.YYYY-MM-DDTHHMMSS.NN.log
-            match_iso = re.search(r'Journal\.(\d{4}-\d{2}-\d{2}T\d{6})\.', filename)
-            if match_iso:
-                timestamp_str = match_iso.group(1)
-                return datetime.strptime(timestamp_str, "%Y-%m-%dT%H%M%S")
-
-            # Try legacy compact format without dashes: Journal.YYYYMMDDHHMMSS.NN.log
-            match_legacy = re.search(r'Journal\.(\d{14})\.', filename)
-            if match_legacy:
-                legacy_str = match_legacy.group(1)
-                return datetime.strptime(legacy_str, "%Y%m%d%H%M%S")
-
-            logger.warning(f"Could not extract timestamp from filename: {filename}")
-            return datetime.fromtimestamp(0)  # Epoch as fallback
-
-        except Exception as e:
-            logger.warning(f"Error parsing timestamp from {file_path.name}: {e}")
-            return datetime.fromtimestamp(0)  # Epoch as fallback
+        return _parse_journal_filename_timestamp(file_path.name)
     
     def get_file_info(self, file_path: Path) -> Dict:
         """
@@ -379,21 +543,23 @@ class JournalParser:
             Dict: File information including size, timestamp, etc.
         """
         try:
-            if not file_path.exists():
+            # One stat call answers existence, size, mtime and file type
+            try:
+                file_stat = file_path.stat()
+            except FileNotFoundError:
                 return {'exists': False, 'error': 'File not found'}
             
-            stat = file_path.stat()
             timestamp = self._extract_timestamp_from_filename(file_path)
             
             return {
                 'exists': True,
                 'path': str(file_path),
                 'name': file_path.name,
-                'size': stat.st_size,
-                'modified': datetime.fromtimestamp(stat.st_mtime),
+                'size': file_stat.st_size,
+                'modified': datetime.fromtimestamp(file_stat.st_mtime),
                 'journal_timestamp': timestamp,
                 'is_backup': file_path.name.endswith('.backup'),
-                'readable': file_path.is_file() and stat.st_size > 0
+                'readable': stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0
             }
             
         except Exception as e:
@@ -407,9 +573,15 @@ class JournalParser:
             Dict: Validation results and directory information
         """
         try:
+            # Single stat for both the existence and directory checks
+            try:
+                directory_mode = self.journal_path.stat().st_mode
+            except (FileNotFoundError, NotADirectoryError):
+                directory_mode = None
+            
             results = {
                 'path': str(self.journal_path),
-                'exists': self.journal_path.exists(),
+                'exists': directory_mode is not None,
                 'is_directory': False,
                 'readable': False,
                 'journal_files_count': 0,
@@ -422,7 +594,7 @@ class JournalParser:
                 results['errors'].append(f"Directory does not exist: {self.journal_path}")
                 return results
             
-            results['is_directory'] = self.journal_path.is_dir()
+            results['is_directory'] = stat.S_ISDIR(directory_mode)
             if not results['is_directory']:
                 results['errors'].append("Path is not a directory")
                 return results
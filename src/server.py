@@ -6,10 +6,13 @@ between Elite Dangerous, Claude Desktop, and EDCoPilot.
 """
 
 import asyncio
+import atexit
 import logging
+import queue
 import sys
 import signal
 import os
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional, Any, Dict, List
 from contextlib import asynccontextmanager
@@ -48,25 +51,23 @@ except ImportError:
 
 # Configure logging
 # When running as MCP server, avoid stdout logging to prevent JSON protocol interference
+# The log file is opened on the first record written, not at import time
+_log_handlers: List[logging.Handler] = [logging.FileHandler('elite_mcp_server.log', delay=True)]
 if len(sys.argv) > 0 and sys.argv[0].endswith('server.py') and '--mcp' not in sys.argv:
-    # Running directly, use both stdout and file logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stderr),  # Use stderr instead of stdout for MCP compatibility
-            logging.FileHandler('elite_mcp_server.log')
-        ]
-    )
-else:
-    # Running as MCP server, only use file logging to avoid JSON protocol interference
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('elite_mcp_server.log')
-        ]
-    )
+    # Running directly, use both stderr and file logging
+    _log_handlers.insert(0, logging.StreamHandler(sys.stderr))  # Use stderr instead of stdout for MCP compatibility
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+# Log calls only enqueue records; a listener thread does the stream and file
+# writes so coroutines never block the event loop on log I/O
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush queued records on exit
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 
 logger = logging.getLogger(__name__)
 
@@ -86,9 +87,9 @@ class EliteDangerousServer:
         # Initialize configuration
         try:
             self.config = EliteConfig()
-            logger.info(f"Configuration loaded: journal_path={self.config.journal_path}")
+            logger.info("Configuration loaded: journal_path=%s", self.config.journal_path)
         except Exception as e:
-            logger.error(f"Failed to load configuration: {e}")
+            logger.error("Failed to load configuration: %s", e)
             raise
         
         # Initialize MCP server
@@ -105,22 +106,31 @@ class EliteDangerousServer:
         # Server state
         self._running = False
         self._monitor_task: Optional[asyncio.Task] = None
+        self._shutdown_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         logger.info("Server initialization completed")
     
     def setup_signal_handlers(self):
         """Set up signal handlers for graceful shutdown."""
         def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, initiating shutdown...")
+            logger.info("Received signal %s, initiating shutdown...", signum)
             self._running = False
+            if self._loop is not None and self._shutdown_event is not None:
+                self._loop.call_soon_threadsafe(self._shutdown_event.set)
         
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
     
     async def load_historical_data(self, hours_back: int = 24):
-        """Load historical journal data from recent files."""
+        """
+        Load historical journal data from recent files.
+
+        The latest journal is skipped: JournalMonitor replays it from the start
+        when monitoring begins, so loading it here would store its events twice.
+        """
         try:
-            logger.info(f"Loading historical data from last {hours_back} hours...")
+            logger.info("Loading historical data from last %d hours...", hours_back)
 
             from src.journal.parser import JournalParser
             from datetime import datetime, timedelta, timezone
@@ -128,45 +138,46 @@ class EliteDangerousServer:
             # Initialize journal parser
             journal_parser = JournalParser(self.config.journal_path)
 
-            # Find recent journal files
-            all_files = journal_parser.find_journal_files()
+            # Directory listing and file reads run in the default executor so
+            # they do not block the event loop
+            loop = asyncio.get_running_loop()
+            all_files = await loop.run_in_executor(None, journal_parser.find_journal_files)
+            live_journal = await loop.run_in_executor(None, journal_parser.get_latest_journal)
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
 
+            # Keep recent files oldest first so events (and the game state they
+            # update) are replayed in the order they happened
             recent_files = []
-            for file_path in all_files:
+            for file_path in reversed(all_files):
+                if file_path == live_journal:
+                    continue
+                # Filename timestamps are naive; read them as UTC like the cutoff
                 file_timestamp = journal_parser._extract_timestamp_from_filename(file_path)
-                if file_timestamp > cutoff_time:
+                if file_timestamp.replace(tzinfo=timezone.utc) > cutoff_time:
                     recent_files.append(file_path)
 
-            logger.info(f"Found {len(recent_files)} recent journal files to process")
+            logger.info("Found %d recent journal files to process", len(recent_files))
 
             events_loaded = 0
             for file_path in recent_files:
-                try:
-                    # Read and process all events from this file
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        for line_no, line in enumerate(f, 1):
-                            try:
-                                # Parse journal entry
-                                event_data = journal_parser.parse_journal_entry(line)
-                                if event_data:
-                                    # Process the event
-                                    processed_event = self.event_processor.process_event(event_data)
-
-                                    # Store in data store
-                                    self.data_store.store_event(processed_event)
-                                    events_loaded += 1
-
-                            except Exception as e:
-                                logger.debug(f"Error processing line {line_no} in {file_path.name}: {e}")
+                # Read one file at a time; read_journal_file logs its own errors
+                entries, _ = await loop.run_in_executor(None, journal_parser.read_journal_file, file_path)
+                for event_data in entries:
+                    try:
+                        # Process the event
+                        processed_event = self.event_processor.process_event(event_data)
 
-                except Exception as e:
-                    logger.warning(f"Error reading historical file {file_path.name}: {e}")
+                        # Store in data store
+                        self.data_store.store_event(processed_event)
+                        events_loaded += 1
 
-            logger.info(f"Loaded {events_loaded} historical events from {len(recent_files)} files")
+                    except Exception as e:
+                        logger.debug("Error processing event in %s: %s", file_path.name, e)
+
+            logger.info("Loaded %d historical events from %d files", events_loaded, len(recent_files))
 
         except Exception as e:
-            logger.error(f"Failed to load historical data: {e}")
+            logger.error("Failed to load historical data: %s", e)
             # Don't raise - this is not critical for server operation
 
     async def start_journal_monitoring(self):
@@ -187,10 +198,10 @@ class EliteDangerousServer:
                         # Store in data store
                         self.data_store.store_event(processed_event)
                         
-                        logger.debug(f"Processed and stored event: {processed_event.event_type}")
+                        logger.debug("Processed and stored event: %s", processed_event.event_type)
                         
                 except Exception as e:
-                    logger.error(f"Error processing journal event: {e}")
+                    logger.error("Error processing journal event: %s", e)
             
             # Initialize journal monitor with required parameters
             self.journal_monitor = JournalMonitor(
@@ -206,7 +217,7 @@ class EliteDangerousServer:
             logger.info("Journal monitoring started successfully")
             
         except Exception as e:
-            logger.error(f"Failed to start journal monitoring: {e}")
+            logger.error("Failed to start journal monitoring: %s", e)
             raise
     
     async def stop_journal_monitoring(self):
@@ -217,21 +228,24 @@ class EliteDangerousServer:
                 await self.journal_monitor.stop_monitoring()
                 logger.info("Journal monitoring stopped")
             except Exception as e:
-                logger.error(f"Error stopping journal monitoring: {e}")
+                logger.error("Error stopping journal monitoring: %s", e)
     
     async def monitor_background_task(self):
         """Background task for journal monitoring."""
         try:
             await self.start_journal_monitoring()
             
-            # Keep monitoring while server is running
-            while self._running:
-                await asyncio.sleep(1)
+            # Keep monitoring until shutdown is requested; the monitor's own
+            # observer thread delivers events, so there is nothing to poll here
+            if self._running:
+                if self._shutdown_event is None:
+                    self._shutdown_event = asyncio.Event()
+                await self._shutdown_event.wait()
                 
         except asyncio.CancelledError:
             logger.info("Background monitoring task cancelled")
         except Exception as e:
-            logger.error(f"Background monitoring task error: {e}")
+            logger.error("Background monitoring task error: %s", e)
         finally:
             await self.stop_journal_monitoring()
     
@@ -254,6 +268,8 @@ class EliteDangerousServer:
             
             # Set running flag
             self._running = True
+            self._shutdown_event = asyncio.Event()
+            self._loop = asyncio.get_running_loop()
             
             # Start background monitoring
             self._monitor_task = asyncio.create_task(self.monitor_background_task())
@@ -261,7 +277,7 @@ class EliteDangerousServer:
             logger.info("Server startup completed successfully")
             
         except Exception as e:
-            logger.error(f"Server startup failed: {e}")
+            logger.error("Server startup failed: %s", e)
             raise
     
     async def shutdown(self):
@@ -271,6 +287,8 @@ class EliteDangerousServer:
         try:
             # Stop running
             self._running = False
+            if self._shutdown_event is not None:
+                self._shutdown_event.set()
             
             # Cancel and wait for background task
             if self._monitor_task and not self._monitor_task.done():
@@ -292,7 +310,7 @@ class EliteDangerousServer:
             logger.info("Server shutdown completed")
             
         except Exception as e:
-            logger.error(f"Error during server shutdown: {e}")
+            logger.error("Error during server shutdown: %s", e)
     
     def setup_basic_mcp_handlers(self):
         """Set up basic MCP handlers for server functionality."""
@@ -314,7 +332,7 @@ class EliteDangerousServer:
                     "last_updated": game_state.last_updated.isoformat() if game_state.last_updated else None
                 }
             except Exception as e:
-                logger.error(f"Error getting server status: {e}")
+                logger.error("Error getting server status: %s", e)
                 return {"error": str(e)}
         
         @self.app.tool()
@@ -340,7 +358,7 @@ class EliteDangerousServer:
                     ]
                 }
             except Exception as e:
-                logger.error(f"Error getting recent events: {e}")
+                logger.error("Error getting recent events: %s", e)
                 return {"error": str(e)}
         
         @self.app.tool()
@@ -351,7 +369,7 @@ class EliteDangerousServer:
                 logger.info("Data store cleared by user request")
                 return {"status": "success", "message": "Data store cleared successfully"}
             except Exception as e:
-                logger.error(f"Error clearing data store: {e}")
+                logger.error("Error clearing data store: %s", e)
                 return {"status": "error", "message": str(e)}
     
     def setup_core_mcp_handlers(self):
@@ -784,7 +802,7 @@ class EliteDangerousServer:
                     "resource_types": list(set(r.get("type", "unknown") for r in resources))
                 }
             except Exception as e:
-                logger.error(f"Error listing resources: {e}")
+                logger.error("Error listing resources: %s", e)
                 return {"error": str(e)}
         
         @self.app.tool()
@@ -808,7 +826,7 @@ class EliteDangerousServer:
                     "timestamp": resource_data.get("timestamp") if isinstance(resource_data, dict) else None
                 }
             except Exception as e:
-                logger.error(f"Error getting resource {uri}: {e}")
+                logger.error("Error getting resource %s: %s", uri, e)
                 return {"error": str(e)}
         
         @self.app.tool()
@@ -818,10 +836,10 @@ class EliteDangerousServer:
                 await self.mcp_resources.clear_cache()
                 return {"status": "success", "message": "Resource cache cleared successfully"}
             except Exception as e:
-                logger.error(f"Error clearing resource cache: {e}")
+                logger.error("Error clearing resource cache: %s", e)
                 return {"status": "error", "message": str(e)}
         
-        logger.info(f"Registered {len(self.mcp_resources.resources)} MCP resources as tools")
+        logger.info("Registered %d MCP resources as tools", len(self.mcp_resources.resources))
 
     def setup_mcp_prompts(self):
         """Set up MCP prompt handlers for context-aware AI assistance."""
@@ -837,7 +855,7 @@ class EliteDangerousServer:
                     "prompt_types": list(set(p["type"] for p in prompts))
                 }
             except Exception as e:
-                logger.error(f"Error listing prompts: {e}")
+                logger.error("Error listing prompts: %s", e)
                 return {"error": str(e)}
         
         @self.app.tool()
@@ -886,7 +904,7 @@ class EliteDangerousServer:
                 }
                 
             except Exception as e:
-                logger.error(f"Error generating analysis prompt: {e}")
+                logger.error("Error generating analysis prompt: %s", e)
                 return {"error": str(e)}
         
         @self.app.tool()
@@ -963,10 +981,10 @@ class EliteDangerousServer:
                 }
                 
             except Exception as e:
-                logger.error(f"Error generating custom prompt: {e}")
+                logger.error("Error generating custom prompt: %s", e)
                 return {"error": str(e)}
         
-        logger.info(f"Registered {len(self.mcp_prompts.templates)} MCP prompt templates")
+        logger.info("Registered %d MCP prompt templates", len(self.mcp_prompts.templates))
 
 
 # Global server instance
@@ -1000,50 +1018,18 @@ async def lifespan_manager():
         await server.shutdown()
 
 
-async def main():
-    """Main entry point for the MCP server."""
-    try:
-        # Create and set up the server
-        server = await create_server()
-
-        # Start server components but don't run the app yet
-        await server.startup()
-
-        try:
-            # Run the MCP server - this will handle its own event loop
-            await server.app.run()
-        finally:
-            # Clean shutdown
-            await server.shutdown()
-
-    except KeyboardInterrupt:
-        logger.info("Server stopped by user")
-    except Exception as e:
-        logger.error(f"Server error: {e}")
-        raise  # Re-raise instead of sys.exit to avoid issues in MCP context
-
-
 def run_server():
     """Convenience function to run the server."""
     try:
-        asyncio.run(main())
+        main()
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
-        logger.error(f"Failed to start server: {e}")
+        logger.error("Failed to start server: %s", e)
         sys.exit(1)
 
 
 # For FastMCP servers, we need to run the app directly without asyncio wrappers
-async def run_mcp_server():
-    """Run the FastMCP server directly."""
-    server = await create_server()
-    await server.startup()
-    try:
-        await server.app.run()
-    finally:
-        await server.shutdown()
-
 def main():
     """Main server entry point."""
     # Setup asyncio for our background tasks
@@ -1077,5 +1063,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         sys.exit(1)
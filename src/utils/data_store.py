@@ -11,7 +11,8 @@ from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Dict, List, Optional, Set, Any, Callable, Union
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from itertools import islice
 
 from ..journal.events import ProcessedEvent, EventCategory
 from .date_parser import parse_date_range, DateParseError
@@ -130,6 +131,10 @@ class DataStore:
         
         # Event storage
         self._events: deque[ProcessedEvent] = deque(maxlen=max_events)
+        
+        # Number of adjacent stored pairs whose timestamps are out of order;
+        # while it is zero, time-window queries can stop at the window start
+        self._inversions = 0
         self._events_by_type: Dict[str, List[ProcessedEvent]] = defaultdict(list)
         self._events_by_category: Dict[EventCategory, List[ProcessedEvent]] = defaultdict(list)
         
@@ -148,6 +153,9 @@ class DataStore:
         # Cleanup tracking
         self._last_cleanup = time.time()
         
+        # Bumped on every change to stored events or game state
+        self._version = 0
+        
         # State update handlers
         self._state_handlers: Dict[str, Callable[[ProcessedEvent], None]] = {
             'FSDJump': self._handle_fsd_jump,
@@ -180,8 +188,16 @@ class DataStore:
         """
         try:
             with self._lock:
-                # Add to main storage
-                self._events.append(event)
+                # Add to main storage, keeping the inversion count in step with
+                # the pair that eviction drops and the pair the new event adds
+                events = self._events
+                if events:
+                    evicting = len(events) == events.maxlen
+                    if evicting and len(events) > 1 and self._is_inversion(events[0], events[1]):
+                        self._inversions -= 1
+                    if not (evicting and len(events) == 1) and self._is_inversion(events[-1], event):
+                        self._inversions += 1
+                events.append(event)
                 
                 # Add to type-specific storage
                 self._events_by_type[event.event_type].append(event)
@@ -196,6 +212,7 @@ class DataStore:
                 
                 # Update game state
                 self._update_game_state(event)
+                self._version += 1
                 
                 # Perform cleanup if needed
                 self._cleanup_if_needed()
@@ -217,7 +234,14 @@ class DataStore:
             List of events matching the criteria
         """
         with self._lock:
-            events = list(self._events)
+            events = None
+            if filter_criteria and filter_criteria.start_time:
+                events = self._events_since(filter_criteria.start_time)
+                if events is not None:
+                    # _events_since already applied the start time
+                    filter_criteria = replace(filter_criteria, start_time=None)
+            if events is None:
+                events = list(self._events)
             
             # Apply filters
             if filter_criteria:
@@ -423,6 +447,8 @@ class DataStore:
             # Update statistics
             removed_count = initial_count - len(self._events)
             self._stats['last_cleanup'] = time.time()
+            if removed_count:
+                self._version += 1
             
             return removed_count
     
@@ -430,6 +456,7 @@ class DataStore:
         """Clear all stored events and reset game state."""
         with self._lock:
             self._events.clear()
+            self._inversions = 0
             self._events_by_type.clear()
             self._events_by_category.clear()
             self._game_state = GameState()
@@ -438,9 +465,47 @@ class DataStore:
             self._stats['events_by_type_count'].clear()
             self._stats['events_by_category_count'].clear()
             self._stats['last_cleanup'] = time.time()
+            self._version += 1
+    
+    def get_version(self) -> int:
+        """Get the change counter for stored data (equal values mean nothing changed)."""
+        with self._lock:
+            return self._version
     
     # Private methods
     
+    def _events_since(self, start_time: datetime) -> Optional[List[ProcessedEvent]]:
+        """
+        Get stored events from start_time on by walking back from the newest end.
+        
+        Only the matching tail is visited, so recent windows cost time in
+        proportion to the events returned rather than to the whole store.
+        
+        Returns None when stored events are not in time order (or their
+        timestamps cannot be compared) and the caller has to filter instead.
+        """
+        if self._inversions:
+            return None
+        events = []
+        try:
+            for event in reversed(self._events):
+                if event.timestamp < start_time:
+                    break
+                events.append(event)
+        except TypeError:
+            return None
+        events.reverse()
+        return events
+    
+    @staticmethod
+    def _is_inversion(earlier: ProcessedEvent, later: ProcessedEvent) -> bool:
+        """Check whether two adjacent stored events are out of time order."""
+        try:
+            return later.timestamp < earlier.timestamp
+        except TypeError:
+            # Naive and aware timestamps cannot be ordered
+            return True
+    
     def _apply_filters(self, events: List[ProcessedEvent], filter_criteria: EventFilter) -> List[ProcessedEvent]:
         """Apply filter criteria to events."""
         filtered_events = events
@@ -770,6 +835,11 @@ class DataStore:
         self._events_by_type.clear()
         self._events_by_category.clear()
         
+        # Dropping events can leave the remaining timeline back in order
+        self._inversions = sum(
+            map(self._is_inversion, self._events, islice(self._events, 1, None))
+        )
+        
         for event in self._events:
             self._events_by_type[event.event_type].append(event)
             self._events_by_category[event.category].append(event)
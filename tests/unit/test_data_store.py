@@ -266,6 +266,22 @@ class TestDataStore:
         assert len(recent_events) == 2
         assert all(e.event_type.startswith("Recent") for e in recent_events)
     
+    def test_get_recent_events_out_of_order(self):
+        """Test that recent events are found when events were stored out of time order."""
+        base_time = datetime.now(timezone.utc)
+        events = [
+            self.create_test_event("Recent1", timestamp=base_time - timedelta(minutes=30)),
+            self.create_test_event("Old", timestamp=base_time - timedelta(hours=2)),
+            self.create_test_event("Recent2", timestamp=base_time - timedelta(minutes=15)),
+        ]
+        
+        for event in events:
+            self.data_store.store_event(event)
+        
+        recent_events = self.data_store.get_recent_events(minutes=60)
+        
+        assert sorted(e.event_type for e in recent_events) == ["Recent1", "Recent2"]
+    
     def test_game_state_tracking_fsd_jump(self):
         """Test game state updates for FSD jump events."""
         event = ProcessedEvent(
@@ -346,7 +362,49 @@ class TestDataStore:
         remaining_events = self.data_store.query_events()
         assert len(remaining_events) == 2
         assert all(e.event_type.startswith("Recent") for e in remaining_events)
-    
+
+    def test_recent_events_after_cleanup_of_out_of_order_event(self):
+        """Test recent-event windows after cleanup removes an out-of-order event."""
+        base_time = datetime.now(timezone.utc)
+        events = [
+            self.create_test_event("Recent1", timestamp=base_time - timedelta(hours=1)),
+            self.create_test_event("Old", timestamp=base_time - timedelta(hours=30)),
+            self.create_test_event("Recent2", timestamp=base_time - timedelta(minutes=30)),
+            self.create_test_event("Recent3", timestamp=base_time),
+        ]
+
+        for event in events:
+            self.data_store.store_event(event)
+
+        self.data_store.cleanup_old_events(max_age_hours=24)
+
+        recent_events = self.data_store.get_recent_events(minutes=45)
+        assert [e.event_type for e in recent_events] == ["Recent3", "Recent2"]
+
+    def test_recent_events_after_out_of_order_event_is_evicted(self):
+        """Test recent-event windows once an out-of-order event has been evicted."""
+        data_store = DataStore(max_events=3)
+        base_time = datetime.now(timezone.utc)
+        timestamps = [
+            ("Late", base_time - timedelta(minutes=10)),
+            ("Early", base_time - timedelta(minutes=50)),
+            ("Next1", base_time - timedelta(minutes=40)),
+            ("Next2", base_time - timedelta(minutes=20)),
+            ("Next3", base_time),
+        ]
+
+        for event_type, timestamp in timestamps:
+            data_store.store_event(self.create_test_event(event_type, timestamp=timestamp))
+            recent_events = data_store.get_recent_events(minutes=30)
+            stored = data_store.query_events()
+            expected = sorted(
+                (e for e in stored if e.timestamp >= base_time - timedelta(minutes=30)),
+                key=lambda e: e.timestamp, reverse=True
+            )
+            assert [e.event_type for e in recent_events] == [e.event_type for e in expected]
+
+        assert [e.event_type for e in data_store.get_recent_events(minutes=30)] == ["Next3", "Next2"]
+
     def test_performance_with_large_numbers(self):
         """Test performance with large numbers of events."""
         start_time = time.time()
@@ -471,6 +529,24 @@ class TestDataStore:
         # total_processed should not be reset (cumulative)
         assert stats['total_processed'] == 10
 
+    def test_version_changes_on_mutation(self):
+        """Test that the change counter moves only when stored data changes."""
+        initial_version = self.data_store.get_version()
+        
+        self.data_store.query_events()
+        self.data_store.get_game_state()
+        assert self.data_store.get_version() == initial_version
+        
+        self.data_store.store_event(self.create_test_event())
+        stored_version = self.data_store.get_version()
+        assert stored_version > initial_version
+        
+        assert self.data_store.cleanup_old_events(max_age_hours=24) == 0
+        assert self.data_store.get_version() == stored_version
+        
+        self.data_store.clear()
+        assert self.data_store.get_version() > stored_version
+
 
 class TestGlobalDataStore:
     """Test suite for global data store functions."""
@@ -8,9 +8,10 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import orjson
 import pytest
 
-from src.journal.parser import JournalParser
+from src.journal.parser import JournalParser, _parse_journal_filename_timestamp
 
 
 def generate_valid_timestamp(base_timestamp: str, index: int) -> str:
@@ -154,6 +155,40 @@ class TestJournalParser:
         files = parser.find_journal_files()
         assert files == []
     
+    def test_find_journal_files_cached_until_directory_changes(self, parser, temp_journal_dir):
+        """Test that directory scans are reused until the directory mtime changes."""
+        # Age the directory so its mtime is outside the granularity window
+        old_time = time.time() - 60
+        os.utime(temp_journal_dir, (old_time, old_time))
+
+        first = parser.find_journal_files()
+        with patch('src.journal.parser.os.scandir', wraps=os.scandir) as scandir_mock:
+            second = parser.find_journal_files()
+            assert scandir_mock.call_count == 0
+        assert second == first
+        assert second is not first  # Callers get their own copy
+
+        # Adding a file bumps the directory mtime and invalidates the cache
+        new_journal = temp_journal_dir / "Journal.20240907120000.01.log"
+        new_journal.write_text('{"timestamp":"2024-09-07T12:00:00Z","event":"Fileheader"}\n')
+        os.utime(temp_journal_dir, (old_time + 30, old_time + 30))
+
+        files = parser.find_journal_files()
+        assert files[0] == new_journal
+        assert len(files) == len(first) + 1
+
+    def test_get_latest_journal_shares_directory_cache(self, parser, temp_journal_dir):
+        """Test that get_latest_journal fills and reuses the same scan cache."""
+        old_time = time.time() - 60
+        os.utime(temp_journal_dir, (old_time, old_time))
+
+        latest = parser.get_latest_journal(include_backups=False)
+        with patch('src.journal.parser.os.scandir', wraps=os.scandir) as scandir_mock:
+            files = parser.find_journal_files(include_backups=False)
+            assert parser.get_latest_journal(include_backups=False) == latest
+            assert scandir_mock.call_count == 0
+        assert files[0] == latest
+
     def test_get_latest_journal(self, parser):
         """Test getting latest journal file."""
         latest = parser.get_latest_journal(include_backups=False)
@@ -213,7 +248,7 @@ class TestJournalParser:
         
         assert entries == []
         assert position == 0
-    
+
     def test_read_journal_file_incremental(self, parser, temp_journal_dir):
         """Test incremental file reading."""
         # Create a test file
@@ -267,12 +302,14 @@ class TestJournalParser:
             Path("Journal.20240906120000.01.log"),
             Path("Journal.20231225235959.99.log.backup"),
             Path("Journal.20200101000000.01.log"),
+            Path("Journal.2025-01-15T103045.01.log"),
         ]
         
         expected_timestamps = [
             datetime(2024, 9, 6, 12, 0, 0),
             datetime(2023, 12, 25, 23, 59, 59),
             datetime(2020, 1, 1, 0, 0, 0),
+            datetime(2025, 1, 15, 10, 30, 45),
         ]
         
         for file_path, expected in zip(test_files, expected_timestamps):
@@ -290,7 +327,22 @@ class TestJournalParser:
         for file_path in invalid_files:
             result = parser._extract_timestamp_from_filename(file_path)
             assert result == datetime.fromtimestamp(0)  # Epoch fallback
-    
+
+    def test_extract_timestamp_from_filename_cached(self, parser):
+        """Test that filename timestamps are parsed once and shared across parsers."""
+        file_path = Path("Journal.20240906120000.01.log")
+        _parse_journal_filename_timestamp.cache_clear()
+
+        first = parser._extract_timestamp_from_filename(file_path)
+        second = JournalParser(Path("/other/dir"))._extract_timestamp_from_filename(
+            Path("/other/dir") / file_path.name
+        )
+
+        assert first == second == datetime(2024, 9, 6, 12, 0, 0)
+        cache_info = _parse_journal_filename_timestamp.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+
     def test_get_file_info(self, parser):
         """Test getting file information."""
         latest_file = parser.get_latest_journal()
@@ -504,7 +556,82 @@ class TestJournalParserEdgeCases:
         # Should still process the file (with potential character replacements)
         assert len(entries) >= 0  # May be 0 if JSON parsing fails due to encoding
         assert position > 0
-    
+
+    def test_read_journal_file_byte_positions(self, isolated_temp_dir):
+        """Test that returned positions are byte offsets usable for incremental reads."""
+        parser = JournalParser(isolated_temp_dir)
+
+        journal = isolated_temp_dir / "Journal.20240906183000.01.log"
+        first = '{"timestamp":"2024-09-06T18:30:00Z","event":"First","Name":"\u00c7a va"}\n'.encode('utf-8')
+        second = b'{"timestamp":"2024-09-06T18:31:00Z","event":"Second","data":"caf\xe9"}\n'
+        journal.write_bytes(first + second)
+
+        entries, position = parser.read_journal_file(journal)
+        assert position == len(first) + len(second)
+        assert [e["event"] for e in entries] == ["First", "Second"]
+        # Invalid UTF-8 is replaced rather than dropping the entry
+        assert entries[1]["data"] == "caf\ufffd"
+
+        entries, position = parser.read_journal_file(journal, len(first))
+        assert [e["event"] for e in entries] == ["Second"]
+        assert position == len(first) + len(second)
+
+    def test_read_journal_file_partial_trailing_line(self, isolated_temp_dir):
+        """Test that a partially written last line is left for the next incremental read."""
+        parser = JournalParser(isolated_temp_dir)
+
+        journal = isolated_temp_dir / "Journal.20240906183500.01.log"
+        complete = b'{"timestamp":"2024-09-06T18:35:00Z","event":"Complete"}\r\n'
+        partial = b'{"timestamp":"2024-09-06T18:36:00Z","eve'
+        journal.write_bytes(complete + partial)
+
+        entries, position = parser.read_journal_file(journal)
+        assert [e["event"] for e in entries] == ["Complete"]
+        assert position == len(complete)
+
+        # Once the game finishes the line it is picked up from the saved position
+        with open(journal, 'ab') as f:
+            f.write(b'nt":"Finished"}\r\n')
+
+        entries, new_position = parser.read_journal_file_incremental(journal, position)
+        assert [e["event"] for e in entries] == ["Finished"]
+        assert new_position == journal.stat().st_size
+
+    def test_read_journal_file_complete_last_line_without_newline(self, isolated_temp_dir):
+        """Test that a complete final entry without a newline is still read."""
+        parser = JournalParser(isolated_temp_dir)
+
+        journal = isolated_temp_dir / "Journal.20240906183700.01.log"
+        journal.write_bytes(
+            b'{"timestamp":"2024-09-06T18:37:00Z","event":"First"}\n'
+            b'{"timestamp":"2024-09-06T18:38:00Z","event":"Last"}'
+        )
+
+        with patch('src.journal.parser.orjson.loads', wraps=orjson.loads) as loads_mock:
+            entries, position = parser.read_journal_file(journal)
+            assert loads_mock.call_count == 2  # The last line is decoded only once
+        assert [e["event"] for e in entries] == ["First", "Last"]
+        assert position == journal.stat().st_size
+
+    def test_read_journal_file_from_offset(self, isolated_temp_dir):
+        """Test that reading from a saved offset returns only the later lines."""
+        parser = JournalParser(isolated_temp_dir)
+
+        journal = isolated_temp_dir / "Journal.20240906184000.01.log"
+        lines = [
+            b'{"timestamp":"2024-09-06T18:40:00Z","event":"First"}\n',
+            b'{"timestamp":"2024-09-06T18:41:00Z","event":"Second"}\n',
+        ]
+        journal.write_bytes(b"".join(lines))
+
+        entries, position = parser.read_journal_file(journal)
+        assert [e["event"] for e in entries] == ["First", "Second"]
+        assert position == sum(len(line) for line in lines)
+
+        entries, position = parser.read_journal_file(journal, len(lines[0]))
+        assert [e["event"] for e in entries] == ["Second"]
+        assert position == sum(len(line) for line in lines)
+
     def test_extremely_long_lines(self, isolated_temp_dir):
         """Test handling of extremely long journal entry lines."""
         parser = JournalParser(isolated_temp_dir)
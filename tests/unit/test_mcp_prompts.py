@@ -58,6 +58,19 @@ class TestPromptTemplate:
         assert "Commander" in result
         assert "[CREDITS_NOT_AVAILABLE]" in result
     
+    def test_template_render_format_specs_and_defaults(self):
+        """Test format specs, escaped braces and numeric defaults for None values."""
+        template = PromptTemplate(
+            name="Test Template",
+            description="A test template",
+            template="{name!r} has {credits:,} CR after {distance_ly:.1f} LY {{ok}}",
+            variables=["name", "credits", "distance_ly"]
+        )
+
+        result = template.render({"name": "Commander", "credits": 1234567, "distance_ly": None})
+
+        assert result == "'Commander' has 1,234,567 CR after 0.0 LY {ok}"
+
     def test_template_render_error_handling(self):
         """Test template rendering error handling."""
         template = PromptTemplate(
@@ -123,6 +136,7 @@ class TestMCPPrompts:
         store.get_recent_events.return_value = [mock_event1, mock_event2, mock_event3]
         store.get_events_by_type.return_value = [mock_event1]
         store.get_events_by_category.return_value = [mock_event2]
+        store.get_version.return_value = 0
         
         return store
     
@@ -290,6 +304,9 @@ class TestMCPPrompts:
         assert "strategic" in result.lower() or "planning" in result.lower()
         assert "Sol" in result  # Current system
         assert "Python" in result  # Current ship
+        
+        # The builder reuses the game state fetched for the base context
+        assert mock_data_store.get_game_state.call_count == 1
     
     @pytest.mark.asyncio
     async def test_build_context_basic(self, prompts, mock_data_store):
@@ -327,7 +344,7 @@ class TestMCPPrompts:
             )
         ]
         
-        context = await prompts._build_exploration_context(recent_events, 24)
+        context = await prompts._build_exploration_context(recent_events, 24, mock_data_store.get_game_state())
         
         assert "systems_visited" in context
         assert "bodies_scanned" in context
@@ -371,7 +388,7 @@ class TestMCPPrompts:
             )
         ]
         
-        context = await prompts._build_trading_context(recent_events, 24)
+        context = await prompts._build_trading_context(recent_events, 24, mock_data_store.get_game_state())
         
         assert "cargo_capacity" in context
         assert "total_profit" in context
@@ -404,7 +421,7 @@ class TestMCPPrompts:
             )
         ]
         
-        context = await prompts._build_combat_context(recent_events, 24)
+        context = await prompts._build_combat_context(recent_events, 24, mock_data_store.get_game_state())
         
         assert "bounties_earned" in context
         assert "combat_bonds" in context
@@ -456,7 +473,7 @@ class TestMCPPrompts:
             )]
         }.get(event_type, [])
         
-        context = await prompts._build_mining_context(recent_events, 24)
+        context = await prompts._build_mining_context(recent_events, 24, mock_data_store.get_game_state())
         
         assert "cargo_used" in context
         assert "cargo_capacity" in context
@@ -470,6 +487,34 @@ class TestMCPPrompts:
         assert context["cargo_capacity"] == 284
         assert context["materials_collected"] >= 0
     
+    @pytest.mark.asyncio
+    async def test_build_context_reused_until_data_changes(self, prompts, mock_data_store):
+        """Test that contexts are reused while the data store version is unchanged."""
+        mock_data_store.get_version.return_value = 1
+        
+        # Pin the clock so the test cannot straddle a one-second boundary
+        with patch('src.elite_mcp.mcp_prompts.time.monotonic', return_value=100.0):
+            first = await prompts._build_context("exploration_analysis", 24)
+            first["current_system"] = "Modified by caller"
+            second = await prompts._build_context("exploration_analysis", 24)
+            
+            assert second["current_system"] == "Sol"  # Callers get their own copy
+            assert mock_data_store.get_recent_events.call_count == 1
+            
+            # A data change invalidates the cached context
+            mock_data_store.get_version.return_value = 2
+            await prompts._build_context("exploration_analysis", 24)
+            assert mock_data_store.get_recent_events.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_jump_stats_match_between_contexts(self, prompts, mock_data_store):
+        """Test that exploration and journey contexts summarize jumps the same way."""
+        exploration = await prompts._compute_context("exploration_analysis", 24)
+        journey = await prompts._compute_context("journey_review", 24)
+        
+        assert exploration["distance_ly"] == journey["total_distance"]
+        assert exploration["systems_visited"] == journey["systems_visited"]
+    
     @pytest.mark.asyncio
     async def test_error_handling_build_context(self, prompts, mock_data_store):
         """Test error handling in context building."""
@@ -15,10 +15,10 @@ import asyncio
 import tempfile
 import json
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch, AsyncMock, MagicMock, call
 
-from src.server import EliteDangerousServer, create_server, lifespan_manager
+from src.server import EliteDangerousServer, create_server, lifespan_manager, run_server
 from src.utils.data_store import reset_data_store
 
 
@@ -129,6 +129,61 @@ class TestEliteDangerousServer:
         with pytest.raises(Exception, match="Journal monitoring failed to start"):
             await server.start_journal_monitoring()
     
+    @patch('src.server.EliteConfig')
+    async def test_load_historical_data_replays_oldest_first(self, mock_config):
+        """Test that historical journals are replayed in chronological order."""
+        mock_config_instance = Mock()
+        mock_config_instance.journal_path = self.journal_path
+        mock_config.return_value = mock_config_instance
+        
+        now = datetime.now(timezone.utc)
+        for hours_ago, system in ((3, "Old System"), (2, "New System"), (1, "Live System")):
+            file_time = now - timedelta(hours=hours_ago)
+            journal = self.journal_path / f"Journal.{file_time.strftime('%Y-%m-%dT%H%M%S')}.01.log"
+            event = {
+                "timestamp": file_time.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                "event": "FSDJump",
+                "StarSystem": system
+            }
+            journal.write_text(json.dumps(event) + "\n")
+        
+        server = EliteDangerousServer()
+        await server.load_historical_data(hours_back=24)
+        
+        # The latest journal is left for the monitor to replay
+        assert len(server.data_store.query_events()) == 2
+        assert server.data_store.get_game_state().current_system == "New System"
+    
+    @patch('src.server.EliteConfig')
+    async def test_start_journal_monitoring_stores_each_event_once(self, mock_config):
+        """Test that history loading and the monitor do not both store the latest journal."""
+        mock_config_instance = Mock()
+        mock_config_instance.journal_path = self.journal_path
+        mock_config.return_value = mock_config_instance
+
+        now = datetime.now(timezone.utc)
+        for hours_ago, systems in ((2, ["Old System"]), (1, ["Sol", "Lave", "Achenar"])):
+            file_time = now - timedelta(hours=hours_ago)
+            journal = self.journal_path / f"Journal.{file_time.strftime('%Y-%m-%dT%H%M%S')}.01.log"
+            journal.write_text("".join(
+                json.dumps({
+                    "timestamp": (file_time + timedelta(minutes=i)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    "event": "FSDJump",
+                    "StarSystem": system
+                }) + "\n"
+                for i, system in enumerate(systems)
+            ))
+
+        server = EliteDangerousServer()
+        try:
+            await server.start_journal_monitoring()
+
+            events = server.data_store.query_events()
+            assert sorted(e.raw_event["StarSystem"] for e in events) == ["Achenar", "Lave", "Old System", "Sol"]
+            assert server.data_store.get_game_state().current_system == "Achenar"
+        finally:
+            await server.stop_journal_monitoring()
+    
     @patch('src.server.EliteConfig')
     async def test_stop_journal_monitoring(self, mock_config):
         """Test stopping journal monitoring."""
@@ -226,6 +281,32 @@ class TestEliteDangerousServer:
         assert server._running == False
         mock_task.cancel.assert_called_once()
     
+    @patch('src.server.EliteConfig')
+    @patch('src.server.JournalMonitor')
+    async def test_background_task_waits_for_shutdown_event(self, mock_monitor_class, mock_config):
+        """Test that the background task idles until shutdown is signalled."""
+        mock_config_instance = Mock()
+        mock_config_instance.journal_path = self.journal_path
+        mock_config_instance.validate_paths.return_value = True
+        mock_config.return_value = mock_config_instance
+        
+        mock_monitor = AsyncMock()
+        mock_monitor.start_monitoring.return_value = True
+        mock_monitor_class.return_value = mock_monitor
+        
+        server = EliteDangerousServer()
+        with patch.object(server, 'load_historical_data', AsyncMock()):
+            await server.startup()
+            await asyncio.sleep(0.05)
+            assert not server._monitor_task.done()
+            
+            # Setting the event ends the task without cancellation
+            server._shutdown_event.set()
+            await asyncio.wait_for(server._monitor_task, timeout=1)
+        
+        assert not server._monitor_task.cancelled()
+        mock_monitor.stop_monitoring.assert_called_once()
+    
     @patch('src.server.EliteConfig')
     def test_event_callback_processing(self, mock_config):
         """Test journal event callback processing."""
@@ -608,6 +689,13 @@ class TestServerLifecycle:
                 # Should be called after context exit
                 assert shutdown_called
 
+    def test_run_server_calls_main_once(self):
+        """Test that run_server starts the synchronous main entry point once."""
+        with patch('src.server.main') as mock_main:
+            run_server()
+
+        mock_main.assert_called_once_with()
+
 
 class TestServerIntegration:
     """Test suite for server integration functionality."""